@@ -9,6 +9,9 @@ from interactions import (
     slash_command,
 )
 
+_TEST_EMBED = {"title": "Test", "color": 0x00FF00}
+_PONG_EMBED = {"title": "Pong!", "color": 0x00FF00}
+
 
 @slash_command(
     name="test",
@@ -26,10 +29,11 @@ async def example_slash(ctx: SlashContext, option: str = None) -> None:
     """Example command"""
     await ctx.defer(ephemeral=True)
 
-    embed = Embed(
-        title="Test",
-        description=f"Hello, World! You chose {option} as your option.",
-        color=0x00FF00,
+    embed = Embed.from_dict(
+        {
+            **_TEST_EMBED,
+            "description": f"Hello, World! You chose {option} as your option.",
+        }
     )
     msg = await ctx.send(
         f"Hello, World! You chose {option} as your option.", embed=embed
@@ -52,7 +56,7 @@ async def list_channel_slash(ctx: SlashContext) -> None:
     await ctx.defer(ephemeral=True)
 
     channels = ctx.guild.channels
-    channel_list = "\n".join([f"{channel.name} ({channel.id})" for channel in channels])
+    channel_list = "\n".join(f"{channel.name} ({channel.id})" for channel in channels)
 
     await ctx.send(
         f"Channels in {ctx.guild_id} {ctx.guild.name}:\n{channel_list}", ephemeral=True
@@ -92,7 +96,7 @@ async def list_role_slash(ctx: SlashContext) -> None:
     await ctx.defer(ephemeral=True)
 
     roles = ctx.guild.roles
-    role_list = "\n".join([f"{role.name} ({role.id})" for role in roles])
+    role_list = "\n".join(f"{role.name} ({role.id})" for role in roles)
 
     await ctx.send(f"Roles:\n{role_list}", ephemeral=True)
 
@@ -106,13 +110,17 @@ async def list_member_slash(ctx: SlashContext) -> None:
     await ctx.defer(ephemeral=True)
 
     members = ctx.guild.members
-    member_list = "\n".join(
-        [f"{member.display_name} ({member.id})" for member in members]
-    )
+    member_list = "\n".join(map("{0.display_name} ({0.id})".format, members))
 
     await ctx.send(f"Members:\n{member_list}", ephemeral=True)
 
 
+@interactions.component_callback("example_button")
+async def example_button(ctx: interactions.ComponentContext) -> None:
+    """Example button callback"""
+    await ctx.send(f"You clicked the button on {ctx.message.author.username}'s message")
+
+
 class MyExtension(interactions.Extension):
     """My extension class"""
 
@@ -138,9 +146,10 @@ class MyExtension(interactions.Extension):
 
         await msg.edit(
             context=ctx,
-            embed=interactions.Embed(
-                title="Pong!",
-                description=f"Hello, World! You chose {option} as your option.",
-                color=0x00FF00,
+            embed=interactions.Embed.from_dict(
+                {
+                    **_PONG_EMBED,
+                    "description": f"Hello, World! You chose {option} as your option.",
+                }
             ),
         )
@@ -1,8 +1,12 @@
 """This module contains the unit tests for the commands module."""
 
+import copy
 import unittest
 
+from interactions import Attachment
+
 from commands import (
+    example_button,
     example_slash,
     MyExtension,
     list_channel_slash,
@@ -10,15 +14,37 @@ from commands import (
     list_member_slash,
     list_category_slash,
 )
-from interactions_unittest import ActionType, call_slash, get_client, FakeGuild
+from interactions_unittest import (
+    ActionType,
+    call_component,
+    call_slash,
+    clear_client_pool,
+    get_client,
+    reset_actions,
+    FakeClient,
+    FakeGuild,
+    random_snowflake,
+)
 
 
 class TestCommands(unittest.IsolatedAsyncioTestCase):
     """The unit tests for the commands module."""
 
+    bot: FakeClient
+
+    @classmethod
+    def setUpClass(cls):
+        """Create a single client with the extension loaded for all the tests."""
+        cls.bot = get_client()
+        cls.bot.load_extension("commands")
+
+    async def asyncSetUp(self):
+        """Clear the state left behind by the previous test."""
+        self.bot.reset()
+
     async def test_example_slash(self):
         """Test the example slash command."""
-        actions = await call_slash(example_slash, option="test")
+        actions = await call_slash(example_slash, _client=self.bot, option="test")
 
         self.assertTrue(len(actions) == 4)
         self.assertTrue(
@@ -34,11 +60,41 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
             actions[3].action_type == ActionType.DELETE, f"Action 3: {actions[3]}"
         )
 
+    async def test_reset_keeps_returned_actions(self):
+        """Test that resetting the client leaves earlier actions untouched."""
+        first_actions = await call_slash(
+            example_slash, _client=self.bot, option="first"
+        )
+        self.bot.reset()
+        await call_slash(example_slash, _client=self.bot, option="second")
+
+        self.assertTrue(
+            "first" in first_actions[1].message["content"],
+            f"Action 1: {first_actions[1]}",
+        )
+
+    async def test_send_keeps_recorded_payload(self):
+        """Test that changing a sent embed afterwards leaves the recorded action unchanged."""
+        embed = {"title": "Test", "fields": [{"name": "field", "value": "value"}]}
+
+        async def send_embed(ctx):
+            await ctx.send(embed=embed)
+            embed["title"] = "Changed"
+            embed["fields"][0]["value"] = "changed"
+
+        actions = await call_slash(send_embed, _client=self.bot)
+
+        self.assertTrue(len(actions) == 1)
+        self.assertTrue(
+            actions[0].message["embeds"]
+            == [{"title": "Test", "fields": [{"name": "field", "value": "value"}]}],
+            f"Action 0: {actions[0]}",
+        )
+
     async def test_list_channel_slash(self):
         """Test the list channel slash command."""
-        client = get_client()
         fake_guild = FakeGuild(
-            client=client,
+            client=self.bot,
             channel_names={"welcome": [], "smalltalk": [], "general": []},
             role_names=[],
             member_names={},
@@ -47,7 +103,7 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(fake_guild, "FakeGuild is None")
         actions = await call_slash(
             list_channel_slash,
-            _client=client,
+            _client=self.bot,
             test_ctx_guild=fake_guild,
             test_ctx_channel=fake_guild.channels[0],
         )
@@ -62,6 +118,14 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(
             "Channels" in actions[1].message["content"], f"Action 1: {actions[1]}"
         )
+        self.assertTrue(
+            all(
+                channel.name in actions[1].message["content"]
+                and str(channel.id) in actions[1].message["content"]
+                for channel in fake_guild.channels
+            ),
+            f"Action 1: {actions[1]}",
+        )
         self.assertTrue(
             len(actions[1].message["content"].split("\n")) == 4,
             f'Action 1: {actions[1].message["content"]}',
@@ -69,9 +133,8 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
 
     async def test_list_category_slash(self):
         """Test the list channel slash command."""
-        client = get_client()
         fake_guild = FakeGuild(
-            client=client,
+            client=self.bot,
             channel_names={
                 "welcome": [],
                 "smalltalk": ["chan_a", "chan_b"],
@@ -84,7 +147,7 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(fake_guild, "FakeGuild is None")
         actions = await call_slash(
             list_category_slash,
-            _client=client,
+            _client=self.bot,
             test_ctx_guild=fake_guild,
             test_ctx_channel=fake_guild.channels[0],
         )
@@ -107,9 +170,8 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
 
     async def test_list_role_slash(self):
         """Test the list role slash command."""
-        client = get_client()
         fake_guild = FakeGuild(
-            client=client,
+            client=self.bot,
             channel_names={"welcome": [], "smalltalk": [], "general": []},
             role_names=["admin", "mod", "user"],
             member_names={},
@@ -118,6 +180,7 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(fake_guild, "FakeGuild is None")
         actions = await call_slash(
             list_role_slash,
+            _client=self.bot,
             test_ctx_guild=fake_guild,
             test_ctx_channel=fake_guild.channels[0],
         )
@@ -132,6 +195,14 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(
             "Roles" in actions[1].message["content"], f"Action 1: {actions[1]}"
         )
+        self.assertTrue(
+            all(
+                role.name in actions[1].message["content"]
+                and str(role.id) in actions[1].message["content"]
+                for role in fake_guild.roles
+            ),
+            f"Action 1: {actions[1]}",
+        )
         self.assertTrue(
             len(actions[1].message["content"].split("\n")) == 4,
             f'Action 1: {actions[1].message["content"]}',
@@ -139,9 +210,8 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
 
     async def test_list_member_slash(self):
         """Test the list member slash command."""
-        client = get_client()
         fake_guild = FakeGuild(
-            client=client,
+            client=self.bot,
             channel_names={"welcome": [], "smalltalk": [], "general": []},
             role_names=["admin", "mod", "user"],
             member_names={
@@ -154,6 +224,7 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
         self.assertIsNotNone(fake_guild, "FakeGuild is None")
         actions = await call_slash(
             list_member_slash,
+            _client=self.bot,
             test_ctx_guild=fake_guild,
             test_ctx_channel=fake_guild.channels[0],
         )
@@ -168,17 +239,78 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(
             "Members" in actions[1].message["content"], f"Action 1: {actions[1]}"
         )
+        self.assertTrue(
+            all(
+                member.display_name in actions[1].message["content"]
+                and str(member.id) in actions[1].message["content"]
+                for member in fake_guild.members
+            ),
+            f"Action 1: {actions[1]}",
+        )
         self.assertTrue(
             len(actions[1].message["content"].split("\n")) == 4,
             f'Action 1: {actions[1].message["content"]}',
         )
 
+    async def test_list_role_slash_fused_defer(self):
+        """Test the list role slash command with the defer fused into the send."""
+        fake_guild = FakeGuild(
+            client=self.bot,
+            channel_names={"welcome": []},
+            role_names=["admin", "mod", "user"],
+            member_names={},
+        )
+
+        actions = await call_slash(
+            list_role_slash,
+            _client=self.bot,
+            test_ctx_guild=fake_guild,
+            test_ctx_fuse_defer=True,
+        )
+
+        self.assertTrue(len(actions) == 1)
+        self.assertTrue(
+            actions[0].action_type == ActionType.DEFER_SEND, f"Action 0: {actions[0]}"
+        )
+        defer, send = actions[0].split()
+        self.assertTrue(defer.action_type == ActionType.DEFER, f"Defer: {defer}")
+        self.assertTrue(defer.ephemeral, f"Defer: {defer}")
+        self.assertTrue(send.action_type == ActionType.SEND, f"Send: {send}")
+        self.assertTrue(
+            all(
+                role.name in send.message["content"]
+                and str(role.id) in send.message["content"]
+                for role in fake_guild.roles
+            ),
+            f"Send: {send}",
+        )
+
+    async def test_list_role_slash_defer_noop(self):
+        """Test the list role slash command without recording the defer."""
+        fake_guild = FakeGuild(
+            client=self.bot,
+            channel_names={"welcome": []},
+            role_names=["admin", "mod", "user"],
+            member_names={},
+        )
+
+        actions = await call_slash(
+            list_role_slash,
+            _client=self.bot,
+            test_ctx_guild=fake_guild,
+            test_ctx_defer_noop=True,
+        )
+
+        self.assertTrue(len(actions) == 1)
+        self.assertTrue(
+            actions[0].action_type == ActionType.SEND, f"Action 0: {actions[0]}"
+        )
+
     async def test_extension_ping(self):
         """Test the extension class with the ping slash command."""
-        bot = get_client()
-        bot.load_extension("commands")
-
-        actions = await call_slash(MyExtension.ping_slash, _client=bot, option="test")
+        actions = await call_slash(
+            MyExtension.ping_slash, _client=self.bot, option="test"
+        )
 
         self.assertTrue(len(actions) == 3)
         self.assertTrue(
@@ -190,3 +322,276 @@ class TestCommands(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(
             actions[2].action_type == ActionType.EDIT, f"Action 2: {actions[2]}"
         )
+
+    async def test_example_button_keeps_message_data(self):
+        """Test the example button without modifying the source message data."""
+        guild_id = random_snowflake()
+        user = {
+            "id": random_snowflake(),
+            "username": "user1",
+            "discriminator": "0",
+            "avatar": None,
+        }
+        member = {
+            "roles": [random_snowflake()],
+            "joined_at": "2024-01-01T00:00:00+00:00",
+            "deaf": False,
+            "mute": False,
+        }
+        message_data = {
+            "id": random_snowflake(),
+            "channel_id": random_snowflake(),
+            "guild_id": guild_id,
+            "content": "Click the button",
+            "author": user,
+            "member": member,
+            "mentions": [{**user, "member": member}],
+            "components": [
+                {
+                    "type": 1,
+                    "components": [
+                        {
+                            "type": 2,
+                            "style": 1,
+                            "label": "Click",
+                            "custom_id": "example_button",
+                        }
+                    ],
+                }
+            ],
+        }
+        expected_data = copy.deepcopy(message_data)
+
+        actions = await call_component(
+            example_button,
+            _client=self.bot,
+            test_ctx_message=message_data,
+            test_ctx_custom_id="example_button",
+        )
+
+        self.assertTrue(len(actions) == 1)
+        self.assertTrue(
+            actions[0].action_type == ActionType.SEND, f"Action 0: {actions[0]}"
+        )
+        self.assertTrue(
+            "user1" in actions[0].message["content"], f"Action 0: {actions[0]}"
+        )
+        self.assertTrue(message_data == expected_data, f"Message data: {message_data}")
+
+    async def test_unloaded_extension_is_not_registered(self):
+        """Test that unloading an extension unregisters its commands."""
+        bot = get_client()
+        bot.load_extension("commands")
+        self.assertTrue(bot.has_interaction(MyExtension.ping_slash))
+
+        bot.unload_extension("commands")
+        self.assertFalse(bot.has_interaction(MyExtension.ping_slash))
+
+    async def test_command_is_registered_again_after_unload(self):
+        """Test that calling a command registers it again after its extension was unloaded."""
+        bot = get_client()
+        bot.load_extension("commands")
+        await call_slash(MyExtension.ping_slash, _client=bot, option="test")
+        bot.unload_extension("commands")
+
+        await call_slash(MyExtension.ping_slash, _client=bot, option="test")
+        self.assertTrue(bot.has_interaction(MyExtension.ping_slash))
+
+    async def test_member_roles_follow_guild_order(self):
+        """Test that a member's roles are listed in the guild's role order."""
+        fake_guild = FakeGuild(
+            client=self.bot,
+            channel_names={"welcome": []},
+            role_names=["admin", "mod", "user"],
+            member_names={"user1": ["user", "admin", "user"]},
+        )
+
+        member_roles = [role.name for role in fake_guild.members[0].roles]
+        self.assertTrue(member_roles == ["admin", "user"], f"Roles: {member_roles}")
+
+    async def test_implicit_clients_are_isolated(self):
+        """Test that calls without a client reuse a cleared pooled client."""
+        user_data = {
+            "id": random_snowflake(),
+            "username": "user1",
+            "discriminator": "0",
+            "avatar": None,
+        }
+        clients = []
+        sent_messages = []
+
+        async def first(ctx):
+            clients.append(ctx.client)
+            ctx.client.cache.place_user_data(user_data)
+            FakeGuild(client=ctx.client, channel_names={"welcome": []})
+            sent_messages.append(await ctx.send("first"))
+
+        async def second(ctx):
+            clients.append(ctx.client)
+            try:
+                message = ctx.client.fake_get_message(sent_messages[0].id)
+            except KeyError:
+                message = None
+            user = ctx.client.get_user(user_data["id"])
+            await ctx.send(
+                f"user={user} guilds={len(ctx.client.fake_guilds)} message={message}"
+            )
+
+        await call_slash(first)
+        actions = await call_slash(second)
+
+        self.assertTrue(clients[0] is clients[1], "The pooled client was not reused")
+        self.assertTrue(len(actions) == 1, f"Actions: {actions}")
+        self.assertTrue(
+            actions[0].message["content"] == "user=None guilds=0 message=None",
+            f"Action 0: {actions[0]}",
+        )
+
+    async def test_clear_client_pool(self):
+        """Test that clearing the client pool makes the next call use a new client."""
+        clients = []
+
+        async def record_client(ctx):
+            clients.append(ctx.client)
+
+        await call_slash(record_client)
+        clear_client_pool()
+        await call_slash(record_client)
+
+        self.assertTrue(clients[0] is not clients[1], "The pooled client was reused")
+
+    async def test_reset_actions_reuses_actions(self):
+        """Test that reset_actions hands the actions back for reuse by the same client."""
+
+        async def send(ctx):
+            await ctx.send("first")
+
+        async def send_again(ctx):
+            await ctx.send("second")
+
+        first = await call_slash(send, _client=self.bot)
+        reset_actions(self.bot)
+        second = await call_slash(send_again, _client=self.bot)
+
+        self.assertTrue(second[0] is first[0], "The released action was not reused")
+        # the documented aliasing: the earlier result now reads the new message
+        self.assertTrue(
+            first[0].message["content"] == "second", f"Action 0: {first[0]}"
+        )
+
+    async def test_action_pool_is_per_client_and_bounded(self):
+        """Test that released actions are only reused by their client, up to the pool size."""
+        client = get_client()
+        client.fake_action_pool_size = 1
+
+        async def send_twice(ctx):
+            await ctx.send("first")
+            await ctx.send("second")
+
+        released = await call_slash(send_twice, _client=client)
+        reset_actions(client)
+        other = await call_slash(send_twice, _client=self.bot)
+        reused = await call_slash(send_twice, _client=client)
+
+        self.assertTrue(
+            not any(action in released for action in other),
+            "Another client reused the released actions",
+        )
+        self.assertTrue(
+            sum(action in released for action in reused) == 1,
+            f"Reused actions: {reused}",
+        )
+
+    async def test_message_cache_evicts_least_recently_used(self):
+        """Test that the message cache evicts the least recently used message past its size."""
+        client = get_client()
+        client.fake_cache_size = 2
+        channel_id = random_snowflake()
+        messages = []
+
+        async def send_and_update(ctx):
+            messages.append(await ctx.send("first"))
+            messages.append(await ctx.send("second"))
+            await ctx.client.http.create_reaction(channel_id, messages[0].id, "👍")
+            messages.append(await ctx.send("third"))
+            await ctx.client.http.edit_message(
+                {"content": "edited"}, channel_id, messages[0].id
+            )
+            messages.append(await ctx.send("fourth"))
+
+        await call_slash(send_and_update, _client=client)
+
+        for index in (0, 3):
+            client.fake_get_message(messages[index].id)
+        for index in (1, 2):
+            with self.assertRaises(KeyError, msg=f"Message {index} was not evicted"):
+                client.fake_get_message(messages[index].id)
+
+    async def test_edit_without_message_edits_first_sent(self):
+        """Test that editing without a message edits the first message sent."""
+        messages = []
+
+        async def send_and_edit(ctx):
+            messages.append(await ctx.send("first"))
+            messages.append(await ctx.send("second"))
+            await ctx.edit(content="edited")
+
+        actions = await call_slash(send_and_edit, _client=self.bot)
+
+        self.assertTrue(
+            actions[2].action_type == ActionType.EDIT, f"Action 2: {actions[2]}"
+        )
+        self.assertTrue(
+            actions[2].message["id"] == messages[0].id, f"Action 2: {actions[2]}"
+        )
+        self.assertTrue(
+            self.bot.fake_get_message(messages[0].id).content == "edited",
+            "The first message was not edited",
+        )
+        self.assertTrue(
+            self.bot.fake_get_message(messages[1].id).content == "second",
+            "The second message was edited",
+        )
+
+    async def test_delete_without_message_deletes_first_sent(self):
+        """Test that deleting without a message deletes the first message sent."""
+        messages = []
+
+        async def send_and_delete(ctx):
+            messages.append(await ctx.send("first"))
+            messages.append(await ctx.send("second"))
+            await ctx.delete()
+
+        actions = await call_slash(send_and_delete, _client=self.bot)
+
+        self.assertTrue(
+            actions[2].action_type == ActionType.DELETE, f"Action 2: {actions[2]}"
+        )
+        self.assertTrue(
+            actions[2].message_id == messages[0].id, f"Action 2: {actions[2]}"
+        )
+        self.assertTrue(
+            self.bot.fake_get_message(messages[1].id).content == "second",
+            "The second message was deleted",
+        )
+        with self.assertRaises(KeyError, msg="The first message was not deleted"):
+            self.bot.fake_get_message(messages[0].id)
+
+    async def test_send_rejects_attachments_in_any_iterable(self):
+        """Test that sending an attachment from a generator raises an error."""
+        attachment = Attachment.from_dict(
+            {
+                "id": random_snowflake(),
+                "filename": "file.txt",
+                "size": 0,
+                "url": "https://example.com/file.txt",
+                "proxy_url": "https://example.com/file.txt",
+            },
+            self.bot,
+        )
+
+        async def send_attachment(ctx):
+            await ctx.send("file", files=(item for item in [attachment]))
+
+        with self.assertRaises(ValueError):
+            await call_slash(send_attachment, _client=self.bot)
@@ -44,169 +44,110 @@ class TestPing(unittest.IsolatedAsyncioTestCase):
 ```
 """
 
-import time
+import importlib
 import typing
-from copy import deepcopy
-
-from interactions import Message
-
-from .actions import (
-    ActionType,
-    BaseAction,
-    CreateReactionAction,
-    DeferAction,
-    DeleteAction,
-    EditAction,
-    SendAction,
-    SendChoicesAction,
-    SendModalAction,
-)
-from .helpers import random_snowflake
-from .fake_models import FakeClient, FakeGuild, FakeMember, FakeRole, FakeChannel
-from .fake_contexts import (
-    FakeAutoCompleteContext,
-    FakeComponentContext,
-    FakeSlashContext,
-)
-
-# dummy usage to suppress flake8 error
-_ = ActionType
-_ = BaseAction
-_ = CreateReactionAction
-_ = DeferAction
-_ = DeleteAction
-_ = EditAction
-_ = SendAction
-_ = SendChoicesAction
-_ = SendModalAction
-_ = random_snowflake
-_ = FakeClient
-_ = FakeGuild
-_ = FakeMember
-_ = FakeRole
-_ = FakeChannel
-_ = FakeAutoCompleteContext
-
-
-async def call_slash(
-    func: typing.Callable, *args, _client: FakeClient = None, **kwargs
-):
-    """
-    Call a slash command function with the given arguments.
-
-    :param func: The function to call.
-    :param _client: A FakeClient instance to use.
-    :param args: The positional arguments to pass to the function.
-    :param kwargs: The keyword arguments to pass to the function.
-    :return:
-    """
-    client = _client or FakeClient()
-    if hasattr(func, "scopes") and all(
-        func.resolved_name not in client.interactions_by_scope.get(scope, {})
-        for scope in func.scopes
-    ):
-        client.add_interaction(func)
-    ctx = FakeSlashContext(client)
-    kwargs = organize_kwargs(args, kwargs, ctx)
-    start_time = time.time()
-    await func(ctx, *args, **kwargs)
-
-    return sorted(
-        [
-            action
-            for action in list(ctx.actions + client.actions)
-            if action.creation_time >= start_time
-        ],
-        key=lambda x: x.creation_time,
-    )
 
-
-async def call_autocomplete(
-    func: typing.Callable, *args, input_text: str, _client: FakeClient = None, **kwargs
-):
-    """Call an autocomplete function with the given arguments."""
-    client = _client or FakeClient()
-
-    ctx = FakeAutoCompleteContext(client, input_text)
-    kwargs = organize_kwargs(args, kwargs, ctx)
-    start_time = time.time()
-    await func(client, ctx, *args, **kwargs)
-
-    return sorted(
-        [
-            action
-            for action in list(ctx.actions + client.actions)
-            if action.creation_time >= start_time
-        ],
-        key=lambda x: x.creation_time,
+if typing.TYPE_CHECKING:
+    from .actions import (
+        ActionType,
+        BaseAction,
+        CreateReactionAction,
+        DeferAction,
+        DeferSendAction,
+        DeleteAction,
+        EditAction,
+        SendAction,
+        SendChoicesAction,
+        SendModalAction,
+        reset_actions,
     )
-
-
-def organize_kwargs(args: tuple, kwargs: dict[str, typing.Any], ctx: FakeSlashContext):
-    """
-    Organize the keyword arguments.
-
-    Keyword arguments that start with "test_ctx_" will be set as attributes (without prefix) of
-    the context object and removed from the kwargs.
-
-    :param args: The positional arguments.
-    :param kwargs: The keyword arguments.
-    :param ctx: The context object.
-    """
-    for key, value in kwargs.items():
-        if key.startswith("test_ctx_"):
-            setattr(ctx, key.split("test_ctx_", 1)[1], value)
-
-    ctx.args = args
-    ctx.kwargs = {
-        key: value for key, value in kwargs.items() if not key.startswith("test_ctx")
-    }
-    kwargs = {
-        key: value for key, value in kwargs.items() if not key.startswith("test_ctx")
-    }
-    return kwargs
-
-
-async def call_component(
-    func: typing.Callable, *args, _client: FakeClient = None, **kwargs
-):
-    """
-    Call a component function with the given arguments.
-
-    :param func: The function to call.
-    :param _client: A FakeClient instance to use.
-    :param args: The positional arguments to pass to the function.
-    :param kwargs: The keyword arguments to pass to the function.
-    :return:
-    """
-    client = _client or FakeClient()
-    if all(
-        func.resolved_name not in client.interactions_by_scope.get(scope, {})
-        for scope in func.scopes
-    ):
-        client.add_interaction(func)
-
-    source_message = kwargs.pop("test_ctx_message")
-    source_message = (
-        Message.from_dict(deepcopy(source_message), client)
-        if isinstance(source_message, dict)
-        else source_message
+    from .calls import (
+        call_autocomplete,
+        call_component,
+        call_slash,
+        clear_client_pool,
+        get_client,
+        organize_kwargs,
     )
-    ctx = FakeComponentContext(client, kwargs.pop("test_ctx_custom_id"), source_message)
-    kwargs = organize_kwargs(args, kwargs, ctx)
-    start_time = time.time()
-    await func(ctx, *args, **kwargs)
-
-    return sorted(
-        [
-            action
-            for action in list(ctx.actions + client.actions)
-            if action.creation_time >= start_time
-        ],
-        key=lambda x: x.creation_time,
+    from .helpers import random_snowflake, random_snowflakes
+    from .fake_models import FakeClient, FakeGuild, FakeMember, FakeRole, FakeChannel
+    from .fake_contexts import (
+        FakeAutoCompleteContext,
+        FakeComponentContext,
+        FakeSlashContext,
     )
 
-
-def get_client() -> FakeClient:
-    """Returns a new FakeClient instance."""
-    return FakeClient()
+# public names are imported on first access, so importing the package stays cheap
+_LAZY_ATTRIBUTES = {
+    "ActionType": ".actions",
+    "BaseAction": ".actions",
+    "CreateReactionAction": ".actions",
+    "DeferAction": ".actions",
+    "DeferSendAction": ".actions",
+    "DeleteAction": ".actions",
+    "EditAction": ".actions",
+    "SendAction": ".actions",
+    "SendChoicesAction": ".actions",
+    "SendModalAction": ".actions",
+    "reset_actions": ".actions",
+    "call_autocomplete": ".calls",
+    "call_component": ".calls",
+    "call_slash": ".calls",
+    "clear_client_pool": ".calls",
+    "get_client": ".calls",
+    "organize_kwargs": ".calls",
+    "random_snowflake": ".helpers",
+    "random_snowflakes": ".helpers",
+    "FakeClient": ".fake_models",
+    "FakeGuild": ".fake_models",
+    "FakeMember": ".fake_models",
+    "FakeRole": ".fake_models",
+    "FakeChannel": ".fake_models",
+    "FakeAutoCompleteContext": ".fake_contexts",
+    "FakeComponentContext": ".fake_contexts",
+    "FakeSlashContext": ".fake_contexts",
+}
+
+__all__ = [
+    "ActionType",
+    "BaseAction",
+    "CreateReactionAction",
+    "DeferAction",
+    "DeferSendAction",
+    "DeleteAction",
+    "EditAction",
+    "SendAction",
+    "SendChoicesAction",
+    "SendModalAction",
+    "reset_actions",
+    "call_autocomplete",
+    "call_component",
+    "call_slash",
+    "clear_client_pool",
+    "get_client",
+    "organize_kwargs",
+    "random_snowflake",
+    "random_snowflakes",
+    "FakeClient",
+    "FakeGuild",
+    "FakeMember",
+    "FakeRole",
+    "FakeChannel",
+    "FakeAutoCompleteContext",
+    "FakeComponentContext",
+    "FakeSlashContext",
+]
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Import a public name from its submodule on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names, including the ones not imported yet."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
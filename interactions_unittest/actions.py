@@ -3,9 +3,10 @@ This module contains the different action classes that can be returned by the in
 """
 
 from abc import ABC
+from dataclasses import dataclass, field
 from enum import Enum
 import time
-from typing import Optional
+from typing import ClassVar, Optional
 
 
 class ActionType(str, Enum):
@@ -18,105 +19,124 @@ class ActionType(str, Enum):
     CREATE_REACTION = "create_reaction"
     SEND_MODAL = "send_modal"
     SEND_CHOICES = "send_choices"
+    DEFER_SEND = "defer_send"
 
 
+@dataclass(slots=True, eq=False)
 class BaseAction(ABC):
     """The base action class."""
 
-    action_type: ActionType
-    creation_time: float
-
-    def __init__(self):
-        self.creation_time = time.time_ns()
-
-
+    action_type: ClassVar[ActionType]
+    creation_time: int = field(init=False, default_factory=time.monotonic_ns)
+
+    @classmethod
+    def acquire(cls, client, *args, **fields):
+        """Reuse an action of this class released by the client if there is one, else create it."""
+        pool = client._fake_action_pools.get(cls)
+        if not pool:
+            return cls(*args, **fields)
+        action = pool.pop()
+        action.__init__(*args, **fields)
+        return action
+
+    def release(self, client) -> None:
+        """Hand the action back to the client for reuse; it must not be read after this."""
+        if type(self) not in _POOLED_ACTION_TYPES:
+            return
+        pool = client._fake_action_pools.setdefault(type(self), [])
+        if len(pool) < client.fake_action_pool_size:
+            pool.append(self)
+
+
+@dataclass(slots=True, eq=False)
 class DeferAction(BaseAction):
     """The defer action class with ephemeral attribute."""
 
-    action_type = ActionType.DEFER
+    action_type: ClassVar[ActionType] = ActionType.DEFER
     ephemeral: bool
 
-    def __init__(self, ephemeral: bool):
-        super().__init__()
-        self.ephemeral = ephemeral
-
 
+@dataclass(slots=True, eq=False)
 class SendAction(BaseAction):
     """The send action class with message attribute."""
 
-    action_type = ActionType.SEND
+    action_type: ClassVar[ActionType] = ActionType.SEND
     message: dict
 
-    def __init__(self, message: dict):
-        super().__init__()
-        self.message = message
+
+@dataclass(slots=True, eq=False)
+class DeferSendAction(SendAction):
+    """The fused defer and send action class with message and ephemeral attributes."""
+
+    action_type: ClassVar[ActionType] = ActionType.DEFER_SEND
+    ephemeral: bool
+
+    def split(self) -> tuple[DeferAction, SendAction]:
+        """Split the action into the defer and send actions it replaces."""
+        defer = DeferAction(ephemeral=self.ephemeral)
+        send = SendAction(message=self.message)
+        defer.creation_time = send.creation_time = self.creation_time
+        return defer, send
 
 
+@dataclass(slots=True, eq=False)
 class DeleteAction(BaseAction):
     """The delete action class with message_id attribute."""
 
-    action_type = ActionType.DELETE
+    action_type: ClassVar[ActionType] = ActionType.DELETE
     message_id: int
-    channel_id: Optional[int]
-    reason: Optional[str]
-
-    def __init__(
-        self,
-        message_id: int,
-        channel_id: Optional[int] = None,
-        reason: Optional[str] = None,
-    ):
-        super().__init__()
-        self.message_id = message_id
-        self.channel_id = channel_id
-        self.reason = reason
+    channel_id: Optional[int] = None
+    reason: Optional[str] = None
 
 
+@dataclass(slots=True, eq=False)
 class EditAction(BaseAction):
     """The edit action class with message attribute."""
 
-    action_type = ActionType.EDIT
+    action_type: ClassVar[ActionType] = ActionType.EDIT
     message: dict
-    channel_id: Optional[int]
-
-    def __init__(self, message: dict, channel_id: Optional[int] = None):
-        super().__init__()
-        self.message = message
-        self.channel_id = channel_id
+    channel_id: Optional[int] = None
 
 
+@dataclass(slots=True, eq=False)
 class CreateReactionAction(BaseAction):
     """The create reaction action class with message_id and emoji attributes."""
 
-    action_type = ActionType.CREATE_REACTION
+    action_type: ClassVar[ActionType] = ActionType.CREATE_REACTION
     message_id: int
     emoji: str
-    channel_id: Optional[int]
-
-    def __init__(self, message_id: int, emoji: str, channel_id: Optional[int] = None):
-        super().__init__()
-        self.message_id = message_id
-        self.emoji = emoji
-        self.channel_id = channel_id
+    channel_id: Optional[int] = None
 
 
+@dataclass(slots=True, eq=False)
 class SendModalAction(BaseAction):
     """The send modal action class with modal attribute."""
 
-    action_type = ActionType.SEND_MODAL
+    action_type: ClassVar[ActionType] = ActionType.SEND_MODAL
     modal: dict
 
-    def __init__(self, modal: dict):
-        super().__init__()
-        self.modal = modal
-
 
+@dataclass(slots=True, eq=False)
 class SendChoicesAction(BaseAction):
     """The send choices action class with choices attribute."""
 
-    action_type = ActionType.SEND_CHOICES
+    action_type: ClassVar[ActionType] = ActionType.SEND_CHOICES
     choices: list[dict]
 
-    def __init__(self, choices: list[dict]):
-        super().__init__()
-        self.choices = choices
+
+# the action types created the most, which are the only ones worth reusing
+_POOLED_ACTION_TYPES = frozenset(
+    (SendAction, EditAction, DeleteAction, CreateReactionAction)
+)
+
+
+def reset_actions(client) -> None:
+    """
+    Release the client's actions for reuse and clear its action log.
+
+    Actions returned by earlier calls are recycled, so they must not be kept
+    and read after this.
+    """
+    for action in client.actions:
+        action.release(client)
+    client.actions.clear()
@@ -0,0 +1,163 @@
+"""Helpers to call commands with fake contexts and collect their actions."""
+
+import typing
+
+from interactions import Message
+from interactions.client.smart_cache import GlobalCache
+
+from .actions import BaseAction
+from .helpers import copy_message_data
+from .fake_models import FakeClient
+from .fake_contexts import (
+    FakeAutoCompleteContext,
+    FakeComponentContext,
+    FakeSlashContext,
+)
+
+_CTX_PREFIX = "test_ctx_"
+_CTX_PREFIX_LENGTH = len(_CTX_PREFIX)
+
+# clients used by calls that were not given one, reused across those calls
+_CLIENT_POOL: list[FakeClient] = []
+
+
+def _acquire_client() -> FakeClient:
+    """Take a client from the pool, or create one if the pool is empty."""
+    return _CLIENT_POOL.pop() if _CLIENT_POOL else FakeClient()
+
+
+def _release_client(client: FakeClient) -> None:
+    """Clear the client's state and put it back in the pool."""
+    # the actions were already returned to the caller, so they are not released for reuse
+    client.actions.clear()
+    client._fake_cache.clear()
+    client.fake_guilds.clear()
+    # the library cache holds the users, members, channels and messages the call placed
+    client.cache = GlobalCache(client)
+    _CLIENT_POOL.append(client)
+
+
+def clear_client_pool() -> None:
+    """Drop the pooled clients, so the next call without a client creates a new one."""
+    _CLIENT_POOL.clear()
+
+
+async def _run(
+    func: typing.Callable,
+    ctx: FakeSlashContext,
+    client: FakeClient,
+    args: tuple,
+    kwargs: dict[str, typing.Any],
+    *leading_args,
+) -> tuple[BaseAction, ...]:
+    """
+    Call a function with the context and collect the actions it created.
+
+    :param func: The function to call.
+    :param ctx: The context to call the function with.
+    :param client: The client the context was created with.
+    :param args: The positional arguments to pass to the function.
+    :param kwargs: The keyword arguments to pass to the function.
+    :param leading_args: The arguments to pass before the context.
+    """
+    kwargs = organize_kwargs(args, kwargs, ctx)
+    start_index = len(client.actions)
+    await func(*leading_args, ctx, *args, **kwargs)
+
+    # the contexts and the http client append to the client's action log
+    return tuple(client.actions[start_index:])
+
+
+async def call_slash(
+    func: typing.Callable, *args, _client: FakeClient = None, **kwargs
+):
+    """
+    Call a slash command function with the given arguments.
+
+    :param func: The function to call.
+    :param _client: A FakeClient instance to use. If not given, a pooled client is used,
+        which may be reused by later calls.
+    :param args: The positional arguments to pass to the function.
+    :param kwargs: The keyword arguments to pass to the function.
+    :return: The actions the function created, in creation order.
+    """
+    client = _client or _acquire_client()
+    try:
+        client.ensure_interaction(func)
+        ctx = FakeSlashContext(client)
+        return await _run(func, ctx, client, args, kwargs)
+    finally:
+        if _client is None:
+            _release_client(client)
+
+
+async def call_autocomplete(
+    func: typing.Callable, *args, input_text: str, _client: FakeClient = None, **kwargs
+):
+    """Call an autocomplete function with the given arguments."""
+    client = _client or _acquire_client()
+    try:
+        ctx = FakeAutoCompleteContext(client, input_text)
+        return await _run(func, ctx, client, args, kwargs, client)
+    finally:
+        if _client is None:
+            _release_client(client)
+
+
+def organize_kwargs(args: tuple, kwargs: dict[str, typing.Any], ctx: FakeSlashContext):
+    """
+    Organize the keyword arguments.
+
+    Keyword arguments that start with "test_ctx_" will be set as attributes (without prefix) of
+    the context object and removed from the kwargs.
+
+    :param args: The positional arguments.
+    :param kwargs: The keyword arguments.
+    :param ctx: The context object.
+    """
+    filtered_kwargs = {}
+    for key, value in kwargs.items():
+        if key[:_CTX_PREFIX_LENGTH] == _CTX_PREFIX:
+            setattr(ctx, key[_CTX_PREFIX_LENGTH:], value)
+        else:
+            filtered_kwargs[key] = value
+
+    ctx.args = args
+    ctx.kwargs = filtered_kwargs
+    return filtered_kwargs
+
+
+async def call_component(
+    func: typing.Callable, *args, _client: FakeClient = None, **kwargs
+):
+    """
+    Call a component function with the given arguments.
+
+    :param func: The function to call.
+    :param _client: A FakeClient instance to use. If not given, a pooled client is used,
+        which may be reused by later calls.
+    :param args: The positional arguments to pass to the function.
+    :param kwargs: The keyword arguments to pass to the function.
+    :return: The actions the function created, in creation order.
+    """
+    client = _client or _acquire_client()
+    try:
+        client.ensure_interaction(func)
+
+        source_message = kwargs.pop("test_ctx_message")
+        if isinstance(source_message, dict):
+            source_message = Message.from_dict(
+                copy_message_data(source_message), client
+            )
+        ctx = FakeComponentContext(
+            client, kwargs.pop("test_ctx_custom_id"), source_message
+        )
+        return await _run(func, ctx, client, args, kwargs)
+    finally:
+        if _client is None:
+            _release_client(client)
+
+
+def get_client() -> FakeClient:
+    """Returns a new FakeClient instance."""
+    return FakeClient()
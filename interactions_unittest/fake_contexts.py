@@ -1,7 +1,6 @@
 """Fake context classes for testing purposes."""
 
 import typing
-from copy import deepcopy
 
 import interactions
 from interactions import (
@@ -17,7 +16,6 @@ from interactions import (
     SlashContext,
     Snowflake_Type,
     Sticker,
-    models,
     process_message_payload,
     to_snowflake,
 )
@@ -25,15 +23,24 @@ from interactions import (
 from .actions import (
     BaseAction,
     DeferAction,
+    DeferSendAction,
     DeleteAction,
     EditAction,
     SendAction,
     SendChoicesAction,
     SendModalAction,
 )
-from .helpers import random_snowflake, fake_process_files
+from .helpers import copy_message_data, fake_process_files, random_snowflake
 from .fake_models import FakeChannel, FakeGuild, FakeMember
 
+# the placeholder for the interaction's original response
+_ORIGINAL = "@original"
+
+# plain int flag values, so combining them does not create a MessageFlags per operation
+_EPHEMERAL = MessageFlags.EPHEMERAL.value
+_SUPPRESS_EMBEDS = MessageFlags.SUPPRESS_EMBEDS.value
+_SILENT = MessageFlags.SILENT.value
+
 
 class FakeSlashContext(SlashContext):
     """
@@ -43,10 +50,14 @@ class FakeSlashContext(SlashContext):
     It will avoid calling the Discord API and instead store the actions that
     would be taken in a list. It is meant to be used with the other fake classes
     in this module.
+
+    If fuse_defer is set (e.g. with test_ctx_fuse_defer=True), a message sent
+    right after deferring is recorded as a single DeferSendAction.
+    If defer_noop is set (e.g. with test_ctx_defer_noop=True), deferring is not
+    recorded as an action at all.
     """
 
-    __slots__ = ("actions", "_fake_cache", "http")
-    actions: tuple[BaseAction, ...]
+    __slots__ = ("_fake_cache", "_original_id", "http")
     fake_guild: typing.Optional[FakeGuild] = None
 
     @property
@@ -70,6 +81,9 @@ class FakeSlashContext(SlashContext):
         self.channel_id = value.id
 
     fake_author: typing.Optional[FakeMember] = None
+    fuse_defer: bool = False
+    defer_noop: bool = False
+    _last_defer: typing.Optional[DeferAction] = None
 
     @property
     def author(self) -> typing.Optional[FakeMember]:
@@ -80,9 +94,14 @@ class FakeSlashContext(SlashContext):
         self.fake_author = value
         self.author_id = value.id
 
+    @property
+    def actions(self) -> list[BaseAction]:
+        """The client's action log."""
+        return self.client.actions
+
     def __init__(self, client: "interactions.Client"):
-        self.actions = client.actions
         self._fake_cache = client._fake_cache
+        self._original_id = None
         super().__init__(client)
         self.http = self
 
@@ -95,7 +114,10 @@ class FakeSlashContext(SlashContext):
         """
         self.deferred = True
         self.ephemeral = ephemeral
-        self.actions += (DeferAction(ephemeral=ephemeral),)
+        if self.defer_noop:
+            return
+        self._last_defer = DeferAction(ephemeral=ephemeral)
+        self.actions.append(self._last_defer)
 
     async def send(
         self,
@@ -170,7 +192,7 @@ class FakeSlashContext(SlashContext):
         if delete_after is not None:
             print("delete_after is not supported in FakeSlashContext.send yet")
 
-        message_payload = models.discord.message.process_message_payload(
+        message_payload = process_message_payload(
             content=content,
             embeds=embeds or embed,
             components=components,
@@ -182,71 +204,66 @@ class FakeSlashContext(SlashContext):
             **kwargs,
         )
 
-        message_data = deepcopy(message_payload)
+        # the payload shares the caller's embed and component dicts
+        message_data = copy_message_data(message_payload)
         message_data["id"] = random_snowflake()
 
-        self.deconstruct_embeds(message_data)
-
         if message_data:
-            self.actions += (SendAction(message=message_data),)
-            message = Message.from_dict(deepcopy(message_data), self.client)
-            self._fake_cache[message.id] = message
+            if (
+                self.fuse_defer
+                and self.actions
+                and self.actions[-1] is self._last_defer
+            ):
+                action = DeferSendAction(
+                    message=message_data, ephemeral=self._last_defer.ephemeral
+                )
+                action.creation_time = self._last_defer.creation_time
+                self.actions[-1] = action
+            else:
+                self.actions.append(
+                    SendAction.acquire(self.client, message=message_data)
+                )
+            message = Message.from_dict(copy_message_data(message_data), self.client)
+            if self._original_id is None:
+                self._original_id = message.id
+            self.client.fake_cache_message(message.id, message)
             return message
         raise ValueError("Cannot send an empty message")
 
-    @staticmethod
-    def deconstruct_embeds(message_data):
-        """Deconstruct the embeds in the message data."""
-        if "embeds" in message_data:
-            message_data["embeds"] = [
-                embed.to_dict() if isinstance(embed, Embed) else embed
-                for embed in message_data["embeds"]
-            ]
-
     def fake_process_flags(self, suppress_embeds, silent, flags, ephemeral):
         """Construct the flags."""
-        flags = MessageFlags(flags or 0)
+        flags_value = int(flags or 0)
         if ephemeral or self.ephemeral:
-            flags |= MessageFlags.EPHEMERAL
+            flags_value |= _EPHEMERAL
             self.ephemeral = True
         if suppress_embeds:
-            flags |= MessageFlags.SUPPRESS_EMBEDS
+            flags_value |= _SUPPRESS_EMBEDS
         if silent:
-            flags |= MessageFlags.SILENT
-
-        if not flags:
-            flags = MessageFlags(0)
-        if suppress_embeds:
-            if isinstance(flags, int):
-                flags = MessageFlags(flags)
-            flags = flags | MessageFlags.SUPPRESS_EMBEDS
-        if silent:
-            if isinstance(flags, int):
-                flags = MessageFlags(flags)
-            flags = flags | MessageFlags.SILENT
-        return flags
+            flags_value |= _SILENT
+        return MessageFlags(flags_value)
 
     respond = send
 
-    async def delete(self, message: "Snowflake_Type" = "@original") -> None:
+    def _resolve_message_id(self, message: "Snowflake_Type") -> "Snowflake_Type":
+        """Resolve a message to its id, mapping the placeholder to the first sent message."""
+        if message == _ORIGINAL:
+            return _ORIGINAL if self._original_id is None else self._original_id
+        return to_snowflake(message)
+
+    async def delete(self, message: "Snowflake_Type" = _ORIGINAL) -> None:
         """
         Delete a message sent in response to this interaction.
 
         Args:
             message: The message id to delete.
         """
-        self.actions += (
-            DeleteAction(
-                message_id=to_snowflake(message) if message != "@original" else message
-            ),
-        )
-        del self._fake_cache[
-            to_snowflake(message) if message != "@original" else message
-        ]
+        message_id = self._resolve_message_id(message)
+        self.actions.append(DeleteAction.acquire(self.client, message_id=message_id))
+        self._fake_cache.pop(message_id, None)
 
     async def edit(
         self,
-        message: "Snowflake_Type" = "@original",
+        message: "Snowflake_Type" = _ORIGINAL,
         *,
         content: typing.Optional[str] = None,
         embeds: typing.Optional[
@@ -283,30 +300,15 @@ class FakeSlashContext(SlashContext):
             tts=tts,
         )
 
-        self._fake_cache[
-            to_snowflake(message) if message != "@original" else message
-        ].update_from_dict(message_payload)
-        message_data = deepcopy(
-            self._fake_cache[
-                to_snowflake(message) if message != "@original" else message
-            ].to_dict()
-        )
-        message_data["id"] = (
-            to_snowflake(message) if message != "@original" else message
-        )
-
-        if "embeds" in message_data:
-            message_data["embeds"] = [
-                embed.to_dict() if isinstance(embed, Embed) else embed
-                for embed in message_data["embeds"]
-            ]
+        message_id = self._resolve_message_id(message)
+        cached_message = self.client.fake_get_message(message_id)
+        cached_message.update_from_dict(message_payload)
+        message_data = cached_message.to_dict()
+        message_data["id"] = message_id
 
         if message_data:
-            self.actions += (EditAction(message=message_data),)
-            self._fake_cache[message_data["id"]] = Message.from_dict(
-                deepcopy(message_data), self.client
-            )
-            return Message.from_dict(deepcopy(message_data), self.client)
+            self.actions.append(EditAction.acquire(self.client, message=message_data))
+            return cached_message
 
     async def send_modal(self, modal: interactions.Modal) -> dict | interactions.Modal:
         """Send a modal to the user."""
@@ -314,7 +316,7 @@ class FakeSlashContext(SlashContext):
             raise RuntimeError("Cannot send modal after responding")
         payload = modal if isinstance(modal, dict) else modal.to_dict()
 
-        self.actions += (SendModalAction(modal=payload),)
+        self.actions.append(SendModalAction(modal=payload))
         return modal
 
 
@@ -325,6 +327,7 @@ class FakeAutoCompleteContext(FakeSlashContext):
     For simplicity, this class is a subclass of FakeSlashContext instead of BaseInteractionContext.
     """
 
+    __slots__ = ("fake_input_text",)
     fake_input_text: str
 
     @property
@@ -361,8 +364,8 @@ class FakeAutoCompleteContext(FakeSlashContext):
         """
         if len(choices) > 25:
             raise ValueError("You can only send 25 choices at a time")
-        processed_choices = []
-        for choice in choices:
+        processed_choices = [None] * len(choices)
+        for index, choice in enumerate(choices):
             if isinstance(choice, dict):
                 name = choice["name"]
                 value = choice["value"]
@@ -373,8 +376,8 @@ class FakeAutoCompleteContext(FakeSlashContext):
                 name = str(choice)
                 value = choice
 
-            processed_choices.append({"name": name, "value": value})
-        self.actions += (SendChoicesAction(choices=deepcopy(processed_choices)),)
+            processed_choices[index] = {"name": name, "value": value}
+        self.actions.append(SendChoicesAction(choices=processed_choices))
 
     send = send_choices
 
@@ -382,6 +385,7 @@ class FakeAutoCompleteContext(FakeSlashContext):
 class FakeComponentContext(FakeSlashContext):
     """A fake ComponentContext class for testing"""
 
+    __slots__ = ("fake_custom_id", "fake_message")
     fake_custom_id: str
     fake_message: "Message"
 
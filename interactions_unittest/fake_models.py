@@ -1,5 +1,7 @@
 """Fake models for testing purposes."""
 
+import collections
+import itertools
 import typing
 
 from interactions import (
@@ -9,6 +11,7 @@ from interactions import (
     Guild,
     GuildCategory,
     GuildChannel,
+    InteractionCommand,
     Member,
     Message,
     Permissions,
@@ -24,7 +27,7 @@ from .actions import (
     DeleteAction,
     EditAction,
 )
-from .helpers import fake_process_files, random_snowflake
+from .helpers import fake_process_files, random_snowflakes
 
 
 class FakeGuild(Guild):
@@ -79,43 +82,32 @@ class FakeGuild(Guild):
         member_names: dict[str, list[str]] = None,
         **kwargs,
     ):
+        snowflakes = iter(
+            random_snowflakes(
+                2
+                + len(channel_names)
+                + sum(len(sub_channels) for sub_channels in channel_names.values())
+                + len(role_names or ())
+                + len(member_names or ())
+            )
+        )
         super().__init__(
             client=client,
-            id=random_snowflake(),
+            id=next(snowflakes),
             name="VirtualTest",
             preferred_locale="english_us",
-            owner_id=random_snowflake(),
+            owner_id=next(snowflakes),
             *args,
             **kwargs,
         )
-        self.fake_channel = []
-        self.fake_roles = []
-        self.fake_members = []
         self.client.fake_guilds.append(self)
-        for channel, sub_channels in channel_names.items():
-            channel_id = random_snowflake()
-            if not sub_channels:
-                self.channels.append(
-                    FakeChannel(
-                        client=client, name=channel, id=channel_id, guild_id=self.id
-                    )
-                )
-            else:
-                category = FakeCategory(
-                    client=client, name=channel, id=channel_id, guild_id=self.id
-                )
-                self.channels.append(category)
-                for sub_channel_name in sub_channels:
-                    sub_channel = FakeChannel(
-                        client=client,
-                        name=sub_channel_name,
-                        id=random_snowflake(),
-                        parent_id=category.id,
-                        guild_id=self.id,
-                    )
-                    self.channels.append(sub_channel)
-                    category.channels.append(sub_channel)
-        self.roles.extend(
+        self.fake_channel = list(
+            itertools.chain.from_iterable(
+                self._build_channels(channel, sub_channels, client, snowflakes)
+                for channel, sub_channels in channel_names.items()
+            )
+        )
+        self.fake_roles = [
             FakeRole(
                 name=role,
                 client=client,
@@ -123,20 +115,53 @@ class FakeGuild(Guild):
                 position=order,
                 guild_id=self.id,
                 permissions=Permissions.ALL,
-                id=random_snowflake(),
+                id=next(snowflakes),
             )
-            for order, role in enumerate(role_names) or []
-        )
-        self.members.extend(
+            for order, role in enumerate(role_names or ())
+        ]
+        self.fake_members = [
             FakeMember(
                 nick=member,
-                id=random_snowflake(),
-                fake_roles=[role for role in self.roles if role.name in role_names],
+                id=next(snowflakes),
+                fake_roles=self._roles_named(member_roles),
                 guild_id=self.id,
                 client=client,
             )
-            for member, role_names in member_names.items() or []
+            for member, member_roles in (member_names or {}).items()
+        ]
+
+    def _roles_named(self, role_names: list[str]) -> list["FakeRole"]:
+        """Get the guild's roles with the given names, in guild order."""
+        wanted = set(role_names)
+        return [role for role in self.fake_roles if role.name in wanted]
+
+    def _build_channels(
+        self,
+        name: str,
+        sub_channels: list[str],
+        client: "FakeClient",
+        snowflakes: typing.Iterator[int],
+    ) -> list["GuildChannel"]:
+        """Build a channel, or a category followed by its sub-channels."""
+        channel_id = next(snowflakes)
+        if not sub_channels:
+            return [
+                FakeChannel(client=client, name=name, id=channel_id, guild_id=self.id)
+            ]
+        category = FakeCategory(
+            client=client, name=name, id=channel_id, guild_id=self.id
+        )
+        category.channels.extend(
+            FakeChannel(
+                client=client,
+                name=sub_channel,
+                id=next(snowflakes),
+                parent_id=category.id,
+                guild_id=self.id,
+            )
+            for sub_channel in sub_channels
         )
+        return [category, *category.channels]
 
 
 class FakeRole(Role):
@@ -149,7 +174,8 @@ class FakeRole(Role):
 class FakeMember(Member):
     """A fake Member class for testing"""
 
-    fake_roles: list["FakeRole"] = []
+    __slots__ = ("fake_roles",)
+    fake_roles: list["FakeRole"]
 
     @property
     def roles(self) -> typing.List["Role"]:
@@ -192,7 +218,9 @@ class FakeChannel(GuildChannel):
     async def delete_message(self, message: "Snowflake_Type") -> None:
         """Delete a message from the channel."""
         self.client.http.delete_message(self.id, message.id)
-        self.client.actions += (DeleteAction(message_id=message.id),)
+        self.client.actions.append(
+            DeleteAction.acquire(self.client, message_id=message.id)
+        )
 
     def get_message(self, message_id: "Snowflake_Type") -> "Message":
         """Get a message from the channel."""
@@ -212,22 +240,57 @@ class FakeClient(Client):
     to bypass the discord api and store the actions that would be taken in a list.
     """
 
-    __slots__ = ("_fake_cache", "actions")
-    _fake_cache: dict[int, "Message"]
-    actions: tuple[BaseAction, ...]
+    __slots__ = ("_fake_action_pools", "_fake_cache", "actions")
+    _fake_action_pools: dict[type, list[BaseAction]]
+    _fake_cache: collections.OrderedDict[int, "Message"]
+    actions: list[BaseAction]
     fake_guilds: list[FakeGuild]
+    fake_action_pool_size: int = 64
+    fake_cache_size: int = 1024
 
     def fake_get_message(self, message_id: "Snowflake_Type") -> "Message":
-        """Get a message from the cache."""
-        return self._fake_cache[to_snowflake(message_id)]
+        """Get a message from the cache, marking it as the most recently used."""
+        message_id = to_snowflake(message_id)
+        message = self._fake_cache[message_id]
+        self._fake_cache.move_to_end(message_id)
+        return message
+
+    def fake_cache_message(
+        self, message_id: "Snowflake_Type", message: "Message"
+    ) -> None:
+        """Cache a message, evicting the least recently used ones past fake_cache_size."""
+        self._fake_cache[message_id] = message
+        self._fake_cache.move_to_end(message_id)
+        while len(self._fake_cache) > self.fake_cache_size:
+            self._fake_cache.popitem(last=False)
 
     def __init__(self, *args, **kwargs):
-        self._fake_cache = {}
+        self._fake_action_pools = {}
+        self._fake_cache = collections.OrderedDict()
         self.fake_guilds = []
-        self.actions = ()
+        self.actions = []
         super().__init__(*args, **kwargs)
         self.http = FakeHttp(client=self)
 
+    def has_interaction(self, command: "InteractionCommand") -> bool:
+        """Check if the command is registered in any of its scopes."""
+        name = command.resolved_name
+        return any(
+            name in self.interactions_by_scope.get(scope, ())
+            for scope in command.scopes
+        )
+
+    def ensure_interaction(self, command: typing.Callable) -> None:
+        """Register the command if it has scopes and is not registered in any of them."""
+        if getattr(command, "scopes", None) and not self.has_interaction(command):
+            self.add_interaction(command)
+
+    def reset(self) -> None:
+        """Clear the actions, messages and guilds while keeping the registered commands."""
+        self.actions.clear()
+        self._fake_cache.clear()
+        self.fake_guilds.clear()
+
     def __del__(self):
         self._fake_cache.clear()
         del self._fake_cache
@@ -244,9 +307,13 @@ class FakeHttp(HTTPClient):
     This class will simulate any calls made to the discord api.
     """
 
+    @property
+    def actions(self) -> list[BaseAction]:
+        """The client's action log."""
+        return self.client.actions
+
     def __init__(self, *args, client: FakeClient, **kwargs):
         self.client = client
-        self.actions = self.client.actions
         self._fake_cache = self.client._fake_cache
         super().__init__(*args, **kwargs)
 
@@ -257,14 +324,16 @@ class FakeHttp(HTTPClient):
         reason: str | None = None,
     ) -> None:
         """Delete a message from a channel."""
-        self.actions += (
-            DeleteAction(
-                message_id=to_snowflake(message_id),
+        message_id = to_snowflake(message_id)
+        self.actions.append(
+            DeleteAction.acquire(
+                self.client,
+                message_id=message_id,
                 channel_id=int(to_snowflake(channel_id)),
                 reason=reason,
-            ),
+            )
         )
-        del self._fake_cache[to_snowflake(message_id)]
+        self._fake_cache.pop(message_id, None)
 
     async def edit_message(
         self,
@@ -275,13 +344,14 @@ class FakeHttp(HTTPClient):
     ) -> "Message":
         """Edit a message in a channel."""
         fake_process_files(files)
-        message = self._fake_cache[to_snowflake(message_id)]
+        message = self.client.fake_get_message(message_id)
         message.update_from_dict(payload)
-        self._fake_cache[to_snowflake(message_id)] = message
-        self.actions += (
-            EditAction(
-                message=message.to_dict(), channel_id=int(to_snowflake(channel_id))
-            ),
+        self.actions.append(
+            EditAction.acquire(
+                self.client,
+                message=message.to_dict(),
+                channel_id=int(to_snowflake(channel_id)),
+            )
         )
         return message
 
@@ -289,11 +359,13 @@ class FakeHttp(HTTPClient):
         self, channel_id: "Snowflake_Type", message_id: "Snowflake_Type", emoji: str
     ) -> None:
         """Create a reaction on a message."""
-        self._fake_cache[to_snowflake(message_id)].reactions.append(emoji)
-        self.actions += (
-            CreateReactionAction(
-                message_id=to_snowflake(message_id),
+        message_id = to_snowflake(message_id)
+        self.client.fake_get_message(message_id).reactions.append(emoji)
+        self.actions.append(
+            CreateReactionAction.acquire(
+                self.client,
+                message_id=message_id,
                 emoji=emoji,
                 channel_id=to_snowflake(channel_id),
-            ),
+            )
         )
@@ -1,42 +1,73 @@
 """Helper functions for the interactions unit tests."""
 
-import datetime
+from collections.abc import Iterable
 from os import urandom
-import typing
+import time
 
-import interactions
+from interactions import Attachment
+
+# 2015-01-01T00:00:00 UTC, in milliseconds
+_DISCORD_EPOCH = 1420070400000
+
+_ATTACHMENT_ERROR = (
+    "Attachments are not files. "
+    "Attachments only contain metadata about the file, "
+    "not the file itself - to send an attachment, "
+    "you need to download it first. Check Attachment.url"
+)
 
 
 def random_snowflake() -> int:
     """Generate a random snowflake."""
-    timestamp = int(
-        (datetime.datetime.now() - datetime.datetime(2015, 1, 1)).total_seconds() * 1000
-    )
-    worker = int(f"0x{urandom(5).hex()}", 0)
-    process = int(f"0x{urandom(5).hex()}", 0)
-    increment = int(f"0x{urandom(12).hex()}", 0)
+    timestamp = time.time_ns() // 1_000_000 - _DISCORD_EPOCH
+    random_bits = int.from_bytes(urandom(8), "big")
+    worker = (random_bits >> 17) & 0x1F
+    process = (random_bits >> 12) & 0x1F
+    increment = random_bits & 0xFFF
+
+    return (timestamp << 22) | (worker << 17) | (process << 12) | increment
+
+
+def random_snowflakes(count: int) -> list[int]:
+    """
+    Generate the given amount of unique snowflakes.
 
-    return int((timestamp << 22) | (worker << 17) | (process << 12) | increment)
+    The snowflakes share a timestamp and a random worker, process and starting
+    increment, drawn from a single urandom read, and differ by their increment.
+    """
+    timestamp = time.time_ns() // 1_000_000 - _DISCORD_EPOCH
+    first = (timestamp << 22) | (int.from_bytes(urandom(3), "big") & 0x3FFFFF)
+    return list(range(first, first + count))
 
 
 def fake_process_files(files, file=None):
     """Process the files (raise exception if any attachment is used)."""
-    has_files = bool(files or file)
-    is_attachment = (
-        isinstance(file, interactions.models.discord.message.Attachment)
-        or isinstance(files, interactions.models.discord.message.Attachment)
-        or (
-            isinstance(files, typing.Iterable)
-            and any(
-                isinstance(file, interactions.models.discord.message.Attachment)
-                for file in files
-            )
-        )
-    )
-    if has_files and is_attachment:
-        raise ValueError(
-            "Attachments are not files. "
-            "Attachments only contain metadata about the file, "
-            "not the file itself - to send an attachment, "
-            "you need to download it first. Check Attachment.url"
-        )
+    if files is None and file is None:
+        return
+    if isinstance(file, Attachment) or isinstance(files, Attachment):
+        raise ValueError(_ATTACHMENT_ERROR)
+    if isinstance(files, Iterable) and not isinstance(files, (str, bytes)):
+        for item in files:
+            if isinstance(item, Attachment):
+                raise ValueError(_ATTACHMENT_ERROR)
+
+
+def copy_message_data(message_data: dict) -> dict:
+    """
+    Copy message data so that it can be passed to Message.from_dict.
+
+    Message.from_dict updates many nested values in place (the member and mention
+    data, components, attachments, threads and the referenced message, among
+    others), so every nested dict and list is copied. The remaining values are
+    shared, as message data only holds immutable ones besides those.
+    """
+    return _copy_containers(message_data)
+
+
+def _copy_containers(value):
+    """Recursively copy the dicts and lists in a value, sharing everything else."""
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    return value